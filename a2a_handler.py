@@ -2,15 +2,21 @@ from models.a2a import (
     A2AMessage, MessagePart, TaskResult, TaskStatus, 
     Artifact, JSONRPCRequest, JSONRPCResponse
 )
-from typing import List, Dict, Any
+from parsing import extract_python_packages, extract_npm_packages
+from typing import List, Dict, Any, Callable, TypeVar
 from uuid import uuid4
+import asyncio
 import json
-import re
 import base64
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Uploaded files above this size are parsed off the event loop
+LARGE_TEXT_THRESHOLD = 50_000
+
+T = TypeVar("T")
+
 class A2AHandler:
     """Handler for A2A protocol messages"""
     
@@ -179,7 +185,7 @@ class A2AHandler:
         
         # Check if user wants to analyze Python packages
         if "python" in user_text_lower or "pip" in user_text_lower or "requirements" in user_text_lower:
-            packages = self._extract_python_packages(user_text)
+            packages = await self._extract_python_packages(user_text)
             if packages:
                 result = await self.package_checker.analyze_python(packages)
                 return self._format_analysis_result(result, "Python"), [self._create_artifact(result)]
@@ -188,7 +194,7 @@ class A2AHandler:
         
         # Check if user wants to analyze npm packages
         if "npm" in user_text_lower or "node" in user_text_lower or "javascript" in user_text_lower:
-            packages = self._extract_npm_packages(user_text)
+            packages = await self._extract_npm_packages(user_text)
             if packages:
                 result = await self.package_checker.analyze_npm(packages)
                 return self._format_analysis_result(result, "npm"), [self._create_artifact(result)]
@@ -196,8 +202,8 @@ class A2AHandler:
                 return "Please provide npm packages to analyze. Example: `express@4.17.1, axios@0.21.1`", []
         
         # Default response - try to extract packages from text
-        python_packages = self._extract_python_packages(user_text)
-        npm_packages = self._extract_npm_packages(user_text)
+        python_packages = await self._extract_python_packages(user_text)
+        npm_packages = await self._extract_npm_packages(user_text)
         
         if python_packages:
             result = await self.package_checker.analyze_python(python_packages)
@@ -237,42 +243,19 @@ class A2AHandler:
         
         return " ".join(content_parts)
     
-    def _extract_python_packages(self, text: str) -> List[str]:
+    async def _extract_python_packages(self, text: str) -> List[str]:
         """Extract Python package specifications from text"""
-        packages = []
-        
-        # Pattern for packages like: flask==2.0.1, requests>=2.25.0
-        pattern = r'\b([a-zA-Z0-9_-]+)\s*([=<>~!]+)\s*([0-9.]+)\b'
-        matches = re.findall(pattern, text)
-        
-        for match in matches:
-            pkg_name, operator, version = match
-            packages.append(f"{pkg_name}{operator}{version}")
-        
-        # Also look for simple package names
-        words = text.split()
-        for word in words:
-            word = word.strip(',')
-            # Check if it looks like a package (contains == or >= etc)
-            if any(op in word for op in ['==', '>=', '<=', '>', '<', '~=']):
-                if word not in packages:
-                    packages.append(word)
-        
-        return packages
+        return await self._run_extractor(extract_python_packages, text)
     
-    def _extract_npm_packages(self, text: str) -> Dict[str, str]:
+    async def _extract_npm_packages(self, text: str) -> Dict[str, str]:
         """Extract npm package specifications from text"""
-        dependencies = {}
-        
-        # Pattern for packages like: express@4.17.1, axios@0.21.1
-        pattern = r'\b([a-zA-Z0-9_-]+)@([0-9.^~]+)\b'
-        matches = re.findall(pattern, text)
-        
-        for match in matches:
-            pkg_name, version = match
-            dependencies[pkg_name] = version
-        
-        return dependencies
+        return await self._run_extractor(extract_npm_packages, text)
+    
+    async def _run_extractor(self, extractor: Callable[[str], T], text: str) -> T:
+        """Run an extractor inline for chat-sized text, or in a worker thread for large uploads"""
+        if len(text) < LARGE_TEXT_THRESHOLD:
+            return extractor(text)
+        return await asyncio.to_thread(extractor, text)
     
     def _format_analysis_result(self, result: Dict[str, Any], ecosystem: str) -> str:
         """Format package analysis result as readable text"""
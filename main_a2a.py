@@ -1,9 +1,15 @@
 from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import JSONResponse
-from typing import List, Dict, Optional, Any
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import List, Dict, Optional, Set, Any, AsyncIterator, Awaitable, Callable, Tuple
 from datetime import datetime
-import requests
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+import asyncio
+import httpx
 import logging
+import orjson
+import os
+from cachetools import TTLCache
 from models.a2a import JSONRPCRequest, JSONRPCResponse
 from models.schemas import (
     PackageDependency,
@@ -13,6 +19,9 @@ from models.schemas import (
     OverallHealthResponse
 )
 from a2a_handler import A2AHandler
+from osv_index import OSVAdvisoryIndex
+from parsing import parse_python_packages, parse_npm_dependencies
+from sqlite_cache import SQLiteCache
 
 # Configure logging
 logging.basicConfig(
@@ -21,151 +30,242 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so registry and OSV lookups multiplex over pooled HTTP/2 connections;
+# created by the lifespan so each app run gets a client bound to its own event loop
+http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, which only exists while the app's lifespan is running"""
+    if http_client is None:
+        raise RuntimeError("HTTP client is not open; run the app inside its lifespan, e.g. `with TestClient(app)`")
+    return http_client
+
+# Opt-in: download OSV's advisory dumps so packages with no advisories skip the OSV query
+OSV_INDEX_ENABLED = os.getenv("OSV_INDEX_ENABLED", "").lower() in ("1", "true", "yes")
+osv_index = OSVAdvisoryIndex(["PyPI", "npm"])
+
+# Opt-in: persist lookups in SQLite so repeat scans survive restarts
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH")
+persistent_cache = SQLiteCache(CACHE_DB_PATH) if CACHE_DB_PATH else None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the HTTP client, optional caches and background tasks, and close them on shutdown"""
+    global http_client, _osv_batch_semaphore, _osv_hydration_semaphore
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    )
+    _osv_batch_semaphore = asyncio.Semaphore(OSV_MAX_CONCURRENT_BATCHES)
+    _osv_hydration_semaphore = asyncio.Semaphore(OSV_MAX_CONCURRENT_HYDRATIONS)
+    if persistent_cache:
+        await persistent_cache.open()
+    index_task = asyncio.create_task(osv_index.run(http_client)) if OSV_INDEX_ENABLED else None
+    yield
+    if index_task:
+        index_task.cancel()
+    # Tasks belong to this run's event loop, so none may outlive it
+    for task in _inflight_fetches.values():
+        task.cancel()
+    _inflight_fetches.clear()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    if persistent_cache:
+        await persistent_cache.close()
+    await http_client.aclose()
+    http_client = _osv_batch_semaphore = _osv_hydration_semaphore = None
+
 # Initializing the api
 app = FastAPI(
     title="Package Health Monitor Agent (A2A)",
     description="An A2A Protocol Agent that monitors package health and security",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Below this many entries parsing is cheaper than handing off to a worker thread
+PARSE_IN_THREAD_THRESHOLD = 500
+
+async def parse_off_loop(parse: Callable[[Any], List[PackageDependency]], items: Any) -> List[PackageDependency]:
+    """Parse small payloads inline and large ones in a worker thread so the event loop keeps serving"""
+    if len(items) < PARSE_IN_THREAD_THRESHOLD:
+        return parse(items)
+    return await asyncio.to_thread(parse, items)
+
 # Package checking class
 class PackageChecker:
     """Class to check package health"""
     
     async def analyze_python(self, packages: List[str]) -> Dict[str, Any]:
         """Analyze Python packages"""
-        parsed_packages = []
-        for pkg_str in packages:
-            pkg_str = pkg_str.strip()
-            if not pkg_str or pkg_str.startswith('#'):
-                continue
-            
-            for op in ['==', '>=', '<=', '>', '<', '~=']:
-                if op in pkg_str:
-                    name, version = pkg_str.split(op, 1)
-                    parsed_packages.append(PackageDependency(name=name.strip(), version=version.strip()))
-                    break
-            else:
-                parsed_packages.append(PackageDependency(name=pkg_str, version=None))
-        
+        parsed_packages = await parse_off_loop(parse_python_packages, packages)
         if not parsed_packages:
             return {}
         
-        results = []
-        outdated_count = 0
-        vulnerable_count = 0
-        deprecated_count = 0
+        return await self._analyze(parsed_packages, "python")
+    
+    async def analyze_npm(self, dependencies: Dict[str, str]) -> Dict[str, Any]:
+        """Analyze npm packages"""
+        packages = await parse_off_loop(parse_npm_dependencies, dependencies)
+        if not packages:
+            return {}
         
-        for pkg in parsed_packages:
-            pypi_info = check_pypi_package(pkg.name, pkg.version)
-            vulnerabilities = check_vulnerabilities_osv(pkg.name, "python")
-            
-            is_outdated = pypi_info['is_outdated']
-            has_vulns = len(vulnerabilities) > 0
-            is_deprecated = pypi_info.get('deprecated', False)
-            
-            if is_outdated:
-                outdated_count += 1
-            if has_vulns:
-                vulnerable_count += 1
-            if is_deprecated:
-                deprecated_count += 1
-            
-            health_score = calculate_health_score(is_outdated, len(vulnerabilities), is_deprecated)
-            recommendation = get_recommendation(health_score, is_outdated, len(vulnerabilities), is_deprecated)
-            
-            results.append({
-                "name": pkg.name,
-                "current_version": pkg.version,
-                "latest_version": pypi_info['latest_version'],
-                "is_outdated": is_outdated,
-                "has_vulnerabilities": has_vulns,
-                "vulnerability_count": len(vulnerabilities),
-                "is_deprecated": is_deprecated,
-                "health_score": health_score,
-                "recommendation": recommendation,
-                "vulnerabilities": vulnerabilities
-            })
+        return await self._analyze(packages, "npm")
+    
+    async def stream_results(self, packages: List[PackageDependency], ecosystem: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield each package result as soon as it is ready, then a summary
         
-        overall_score = sum(r["health_score"] for r in results) // len(results) if results else 0
+        Only running counters are kept and finished checks are dropped as they
+        are yielded, so results don't accumulate over the scan. The final item
+        is the summary (OverallHealthResponse fields without "packages").
+        """
+        pending = {asyncio.ensure_future(check) for check in await self._start_checks(packages, ecosystem)}
+        total = outdated = vulnerable = deprecated = score_sum = 0
         
-        return {
-            "total_packages": len(results),
-            "outdated_count": outdated_count,
-            "vulnerable_count": vulnerable_count,
-            "deprecated_count": deprecated_count,
-            "overall_health_score": overall_score,
-            "packages": results
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    total += 1
+                    outdated += bool(result["is_outdated"])
+                    vulnerable += result["has_vulnerabilities"]
+                    deprecated += bool(result["is_deprecated"])
+                    score_sum += result["health_score"]
+                    yield result
+        finally:
+            # Stop outstanding lookups if the client goes away mid-stream
+            for task in pending:
+                task.cancel()
+        
+        yield {
+            "total_packages": total,
+            "outdated_count": outdated,
+            "vulnerable_count": vulnerable,
+            "deprecated_count": deprecated,
+            "overall_health_score": score_sum // total if total else 0
         }
     
-    async def analyze_npm(self, dependencies: Dict[str, str]) -> Dict[str, Any]:
-        """Analyze npm packages"""
-        if not dependencies:
-            return {}
+    async def _start_checks(self, packages: List[PackageDependency], ecosystem: str) -> List[Awaitable[Dict[str, Any]]]:
+        """Start the shared lookups and return one result coroutine per package"""
+        check_registry = check_pypi_package if ecosystem == "python" else check_npm_package
         
-        packages = []
-        for name, version in dependencies.items():
-            clean_version = version.lstrip('^~>=<')
-            packages.append(PackageDependency(name=name, version=clean_version))
+        # Duplicate specs share one lookup; OSV results only depend on the name
+        unique_names = list(dict.fromkeys(pkg.name for pkg in packages))
         
-        results = []
-        outdated_count = 0
-        vulnerable_count = 0
-        deprecated_count = 0
+        # OSV lookups are started first (this awaits at most one SQLite read) so that no
+        # registry task is left orphaned if starting them fails; both then run concurrently
+        vulnerability_checks = dict(zip(unique_names, await start_vulnerability_checks(unique_names, ecosystem)))
         
+        registry_checks: Dict[Tuple[str, Optional[str]], asyncio.Task] = {}
         for pkg in packages:
-            npm_info = check_npm_package(pkg.name, pkg.version)
-            vulnerabilities = check_vulnerabilities_osv(pkg.name, "npm")
-            
-            is_outdated = npm_info['is_outdated']
-            has_vulns = len(vulnerabilities) > 0
-            is_deprecated = npm_info.get('deprecated', False)
-            
-            if is_outdated:
-                outdated_count += 1
-            if has_vulns:
-                vulnerable_count += 1
-            if is_deprecated:
-                deprecated_count += 1
-            
-            health_score = calculate_health_score(is_outdated, len(vulnerabilities), is_deprecated)
-            recommendation = get_recommendation(health_score, is_outdated, len(vulnerabilities), is_deprecated)
-            
-            results.append({
-                "name": pkg.name,
-                "current_version": pkg.version,
-                "latest_version": npm_info['latest_version'],
-                "is_outdated": is_outdated,
-                "has_vulnerabilities": has_vulns,
-                "vulnerability_count": len(vulnerabilities),
-                "is_deprecated": is_deprecated,
-                "health_score": health_score,
-                "recommendation": recommendation,
-                "vulnerabilities": vulnerabilities
-            })
+            key = (pkg.name, pkg.version)
+            if key not in registry_checks:
+                registry_checks[key] = asyncio.create_task(check_registry(pkg.name, pkg.version))
+        
+        async def _process(pkg: PackageDependency) -> Dict[str, Any]:
+            registry_info, vulnerabilities = await asyncio.gather(
+                registry_checks[(pkg.name, pkg.version)], vulnerability_checks[pkg.name]
+            )
+            return build_package_result(pkg, registry_info, vulnerabilities)
+        
+        return [_process(pkg) for pkg in packages]
+    
+    async def _analyze(self, packages: List[PackageDependency], ecosystem: str) -> Dict[str, Any]:
+        """Check registry info and vulnerabilities for all packages concurrently"""
+        results = await asyncio.gather(*await self._start_checks(packages, ecosystem))
         
         overall_score = sum(r["health_score"] for r in results) // len(results) if results else 0
         
         return {
             "total_packages": len(results),
-            "outdated_count": outdated_count,
-            "vulnerable_count": vulnerable_count,
-            "deprecated_count": deprecated_count,
+            "outdated_count": sum(1 for r in results if r["is_outdated"]),
+            "vulnerable_count": sum(1 for r in results if r["has_vulnerabilities"]),
+            "deprecated_count": sum(1 for r in results if r["is_deprecated"]),
             "overall_health_score": overall_score,
             "packages": results
         }
 
+# Registry and OSV responses are cached in-process so repeat scans skip the network
+CACHE_TTL_SECONDS = 3600
+_pypi_cache: TTLCache = TTLCache(maxsize=10_000, ttl=CACHE_TTL_SECONDS)
+_npm_cache: TTLCache = TTLCache(maxsize=10_000, ttl=CACHE_TTL_SECONDS)
+_osv_cache: TTLCache = TTLCache(maxsize=10_000, ttl=CACHE_TTL_SECONDS)
+_osv_vuln_cache: TTLCache = TTLCache(maxsize=10_000, ttl=CACHE_TTL_SECONDS)
+_inflight_fetches: Dict[str, asyncio.Task] = {}
+
+async def _cached_fetch(cache: TTLCache, key: str, fetch: Callable[[], Awaitable[Any]], persist: bool = True) -> Any:
+    """
+    Return a cached value, fetching it on a miss
+    
+    Memory is checked first, then the persistent cache if one is configured
+    and persist is set.
+    Concurrent misses for the same key share one in-flight task, so only one
+    request reaches the network and every caller gets its result or error.
+    None results are not cached.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    
+    task = _inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.create_task(_load_and_cache(cache, key, fetch, persist))
+        _inflight_fetches[key] = task
+        task.add_done_callback(lambda _: _inflight_fetches.pop(key, None))
+    
+    # Shielded so one caller going away doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+async def _load_and_cache(cache: TTLCache, key: str, fetch: Callable[[], Awaitable[Any]], persist: bool) -> Any:
+    """Read a value from the persistent cache or fetch it, and store it if found"""
+    store = persistent_cache if persist else None
+    value = await store.get(key) if store else None
+    if value is None:
+        value = await fetch()
+        if value is not None and store:
+            await store.set(key, value)
+    if value is not None:
+        cache[key] = value
+    return value
+
 # Helper functions (from original main.py)
-def check_pypi_package(package_name: str, current_version: Optional[str]) -> Dict:
+NPM_ABBREVIATED_METADATA = "application/vnd.npm.install-v1+json"
+
+async def _fetch_pypi_latest_version(client: httpx.AsyncClient, package_name: str) -> Optional[str]:
+    """Fetch the latest released version of a package from PyPI"""
+    response = await client.get(f"https://pypi.org/pypi/{package_name}/json")
+    if response.status_code != 200:
+        return None
+    return orjson.loads(response.content)['info']['version']
+
+async def _fetch_npm_latest_version(client: httpx.AsyncClient, package_name: str) -> Optional[str]:
+    """Fetch the latest dist-tag of a package from the npm registry"""
+    # The abbreviated "corgi" document keeps dist-tags and a trimmed manifest for every version,
+    # but drops readmes and other metadata only needed for display, so it is smaller than the packument
+    response = await client.get(
+        f"https://registry.npmjs.org/{package_name}",
+        headers={"Accept": NPM_ABBREVIATED_METADATA}
+    )
+    if response.status_code != 200:
+        return None
+    return orjson.loads(response.content)['dist-tags']['latest']
+
+async def check_pypi_package(package_name: str, current_version: Optional[str]) -> Dict:
     """Check package on PyPI"""
+    # Outside the lifespan this raises instead of reporting the package as healthy
+    client = get_http_client()
     try:
-        url = f"https://pypi.org/pypi/{package_name}/json"
-        response = requests.get(url, timeout=10)
+        latest_version = await _cached_fetch(
+            _pypi_cache,
+            f"pypi:{package_name.lower()}",
+            lambda: _fetch_pypi_latest_version(client, package_name)
+        )
         
-        if response.status_code == 200:
-            data = response.json()
-            latest_version = data['info']['version']
-            is_outdated = current_version and current_version != latest_version
+        if latest_version is not None:
+            is_outdated = bool(current_version) and current_version != latest_version
             
             logger.info(f"PyPI check: {package_name} - latest: {latest_version}, current: {current_version}, outdated: {is_outdated}")
             
@@ -179,16 +279,19 @@ def check_pypi_package(package_name: str, current_version: Optional[str]) -> Dic
     
     return {'latest_version': None, 'is_outdated': False, 'deprecated': False}
 
-def check_npm_package(package_name: str, current_version: Optional[str]) -> Dict:
+async def check_npm_package(package_name: str, current_version: Optional[str]) -> Dict:
     """Check package on npm registry"""
+    # Outside the lifespan this raises instead of reporting the package as healthy
+    client = get_http_client()
     try:
-        url = f"https://registry.npmjs.org/{package_name}"
-        response = requests.get(url, timeout=10)
+        latest_version = await _cached_fetch(
+            _npm_cache,
+            f"npm:{package_name}",
+            lambda: _fetch_npm_latest_version(client, package_name)
+        )
         
-        if response.status_code == 200:
-            data = response.json()
-            latest_version = data['dist-tags']['latest']
-            is_outdated = current_version and current_version != latest_version
+        if latest_version is not None:
+            is_outdated = bool(current_version) and current_version != latest_version
             
             logger.info(f"npm check: {package_name} - latest: {latest_version}, current: {current_version}, outdated: {is_outdated}")
             
@@ -202,38 +305,238 @@ def check_npm_package(package_name: str, current_version: Optional[str]) -> Dict
     
     return {'latest_version': None, 'is_outdated': False, 'deprecated': False}
 
-def check_vulnerabilities_osv(package_name: str, ecosystem: str) -> List[Dict]:
-    """Check vulnerabilities using OSV API"""
-    vulnerabilities = []
+def _format_vulnerability(vuln: Dict) -> Dict:
+    """Reduce a full OSV vulnerability record to the fields we report"""
+    severity = vuln.get('severity')
+    return {
+        'id': vuln.get('id'),
+        'summary': vuln.get('summary', 'No summary available'),
+        'severity': severity[0].get('type', 'UNKNOWN') if severity else 'UNKNOWN',
+        'published': vuln.get('published', '')
+    }
+
+# OSV caps querybatch at 1000 queries; larger sets are split into chunks that run in
+# parallel. Batches and hydrations are each bounded so big scans don't trip OSV's
+# rate limiting, and 429 responses are retried with exponential backoff
+OSV_BATCH_SIZE = 1000
+OSV_MAX_CONCURRENT_BATCHES = 5
+OSV_MAX_CONCURRENT_HYDRATIONS = 20
+OSV_MAX_RETRIES = 3
+OSV_RETRY_BACKOFF_SECONDS = 1.0
+# Created by the lifespan, since a semaphore binds to the event loop that first contends on it
+_osv_batch_semaphore: Optional[asyncio.Semaphore] = None
+_osv_hydration_semaphore: Optional[asyncio.Semaphore] = None
+
+async def _osv_request(
+    client: httpx.AsyncClient,
+    semaphore: Optional[asyncio.Semaphore],
+    method: str,
+    url: str,
+    **kwargs: Any
+) -> httpx.Response:
+    """Send an OSV request within a concurrency limit, retrying with backoff while rate limited"""
+    if semaphore is None:
+        raise RuntimeError("OSV concurrency limits are not set up; run the app inside its lifespan")
     
-    try:
-        url = "https://api.osv.dev/v1/query"
-        payload = {
-            "package": {
-                "name": package_name,
-                "ecosystem": "PyPI" if ecosystem == "python" else "npm"
-            }
-        }
+    for attempt in range(OSV_MAX_RETRIES + 1):
+        async with semaphore:
+            response = await client.request(method, url, **kwargs)
+        
+        if response.status_code != 429 or attempt == OSV_MAX_RETRIES:
+            return response
         
-        response = requests.post(url, json=payload, timeout=10)
+        delay = OSV_RETRY_BACKOFF_SECONDS * 2 ** attempt
+        logger.warning(f"OSV request to {url} rate limited, retrying in {delay}s")
+        await asyncio.sleep(delay)
+    
+    return response
+
+async def _fetch_osv_vulnerability(client: httpx.AsyncClient, vuln_id: str) -> Optional[Dict]:
+    """Hydrate a single OSV vulnerability by ID, or return None if the lookup failed"""
+    try:
+        response = await _osv_request(client, _osv_hydration_semaphore, "GET", f"https://api.osv.dev/v1/vulns/{vuln_id}")
         if response.status_code == 200:
-            data = response.json()
-            vulns = data.get('vulns', [])
-            
-            for vuln in vulns:
-                vulnerabilities.append({
-                    'id': vuln.get('id'),
-                    'summary': vuln.get('summary', 'No summary available'),
-                    'severity': vuln.get('severity', [{}])[0].get('type', 'UNKNOWN') if vuln.get('severity') else 'UNKNOWN',
-                    'published': vuln.get('published', '')
-                })
+            return _format_vulnerability(orjson.loads(response.content))
     except Exception as e:
-        logger.error(f"Error checking vulnerabilities for {package_name}: {e}")
+        logger.error(f"Error fetching OSV vulnerability {vuln_id}: {e}")
+    
+    return None
+
+async def _query_osv_ids(client: httpx.AsyncClient, package_names: List[str], osv_ecosystem: str) -> Optional[List[List[str]]]:
+    """Run one OSV querybatch call and return the vulnerability IDs found for each package"""
+    payload = {
+        "queries": [
+            {"package": {"name": name, "ecosystem": osv_ecosystem}}
+            for name in package_names
+        ]
+    }
+    
+    try:
+        response = await _osv_request(client, _osv_batch_semaphore, "POST", "https://api.osv.dev/v1/querybatch", json=payload)
+    except Exception as e:
+        logger.error(f"Error checking vulnerabilities for {len(package_names)} {osv_ecosystem} packages: {e}")
+        return None
+    
+    if response.status_code != 200:
+        logger.error(f"OSV querybatch failed with status {response.status_code}")
+        return None
+    
+    # Results come back in the same order as the queries, with only IDs filled in
+    vuln_ids = [
+        [vuln['id'] for vuln in result.get('vulns', [])]
+        for result in orjson.loads(response.content).get('results', [])
+    ]
+    if len(vuln_ids) != len(package_names):
+        logger.error(f"OSV querybatch returned {len(vuln_ids)} results for {len(package_names)} queries")
+        return None
+    
+    return vuln_ids
+
+async def _hydrate_osv_vulnerabilities(client: httpx.AsyncClient, vuln_ids: List[str]) -> Tuple[List[Dict], bool]:
+    """
+    Hydrate one package's vulnerability IDs into full records
+    
+    Packages sharing an advisory share its lookup. Returns the records and
+    whether every one of them could be hydrated.
+    """
+    records = await asyncio.gather(*(
+        _cached_fetch(_osv_vuln_cache, f"osv-vuln:{vuln_id}", partial(_fetch_osv_vulnerability, client, vuln_id), persist=False)
+        for vuln_id in vuln_ids
+    ))
     
-    return vulnerabilities
+    # The batch query already told us the package is affected, so keep the ID of any failed record
+    vulns = [record or _format_vulnerability({'id': vuln_id}) for vuln_id, record in zip(vuln_ids, records)]
+    return vulns, all(record is not None for record in records)
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+
+def _run_in_background(coroutine: Awaitable[Any]) -> None:
+    """Run a coroutine without awaiting it"""
+    task = asyncio.ensure_future(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def _start_osv_chunk(
+    client: httpx.AsyncClient,
+    package_names: List[str],
+    osv_ecosystem: str,
+    cache_keys: List[str]
+) -> List[asyncio.Task]:
+    """Query one chunk of packages and start one task per package that hydrates its own results"""
+    ids_query = asyncio.create_task(_query_osv_ids(client, package_names, osv_ecosystem))
+    complete: Dict[str, List[Dict]] = {}
+    
+    async def _check(position: int) -> List[Dict]:
+        # Shielded so a cancelled package doesn't cancel the query for the rest of the chunk
+        vuln_ids = await asyncio.shield(ids_query)
+        if vuln_ids is None:
+            return []
+        
+        vulns, hydrated = await _hydrate_osv_vulnerabilities(client, vuln_ids[position])
+        
+        # Partially hydrated results are reported but not cached, so the next scan retries them
+        if hydrated:
+            _osv_cache[cache_keys[position]] = vulns
+            complete[cache_keys[position]] = vulns
+        return vulns
+    
+    checks = [asyncio.create_task(_check(position)) for position in range(len(package_names))]
+    
+    async def _persist() -> None:
+        await asyncio.wait(checks)
+        if complete and persistent_cache:
+            await persistent_cache.set_many(complete)
+    
+    if persistent_cache:
+        _run_in_background(_persist())
+    return checks
+
+async def start_vulnerability_checks(package_names: List[str], ecosystem: str) -> List[Awaitable[List[Dict]]]:
+    """
+    Start OSV vulnerability checks for many packages
+    
+    Packages already in the OSV cache (memory, then SQLite if configured) are
+    served from it, and packages the advisory index rules out are skipped; the
+    rest are queried in chunks of up to OSV_BATCH_SIZE packages. Each package
+    resolves as soon as its own advisories are hydrated, without waiting on
+    the rest of the scan.
+    
+    Args:
+        package_names: Package names to check
+        ecosystem: "python" or "npm"
+        
+    Returns:
+        One awaitable list of vulnerabilities per package, in the same order as package_names
+    """
+    # Outside the lifespan this raises instead of reporting no vulnerabilities
+    client = get_http_client()
+    osv_ecosystem = "PyPI" if ecosystem == "python" else "npm"
+    cache_keys = [f"osv:{osv_ecosystem}:{name}" for name in package_names]
+    
+    vulnerabilities: List[Optional[List[Dict]]] = [_osv_cache.get(key) for key in cache_keys]
+    
+    # Packages the advisory index has never seen have nothing to find
+    for index, name in enumerate(package_names):
+        if vulnerabilities[index] is None and not osv_index.may_be_affected(name, osv_ecosystem):
+            vulnerabilities[index] = []
+    
+    missing = [index for index, cached in enumerate(vulnerabilities) if cached is None]
+    
+    if missing and persistent_cache:
+        stored = await persistent_cache.get_many([cache_keys[index] for index in missing])
+        for index in missing:
+            vulns = stored.get(cache_keys[index])
+            if vulns is not None:
+                _osv_cache[cache_keys[index]] = vulns
+                vulnerabilities[index] = vulns
+        missing = [index for index in missing if vulnerabilities[index] is None]
+    
+    checks: List[Optional[Awaitable[List[Dict]]]] = [None] * len(package_names)
+    for start in range(0, len(missing), OSV_BATCH_SIZE):
+        chunk = missing[start:start + OSV_BATCH_SIZE]
+        chunk_checks = _start_osv_chunk(
+            client,
+            [package_names[index] for index in chunk],
+            osv_ecosystem,
+            [cache_keys[index] for index in chunk]
+        )
+        for index, check in zip(chunk, chunk_checks):
+            checks[index] = check
+    
+    # Everything not queried is already known; hand it back as a resolved future
+    loop = asyncio.get_running_loop()
+    results: List[Awaitable[List[Dict]]] = []
+    for queried, vulns in zip(checks, vulnerabilities):
+        if queried is not None:
+            results.append(queried)
+        else:
+            resolved = loop.create_future()
+            resolved.set_result(vulns)
+            results.append(resolved)
+    
+    return results
+
+async def check_vulnerabilities_osv_batch(package_names: List[str], ecosystem: str) -> List[List[Dict]]:
+    """Check vulnerabilities for many packages, returning one list per package in the same order"""
+    return list(await asyncio.gather(*await start_vulnerability_checks(package_names, ecosystem)))
+
+async def check_vulnerabilities_osv(package_name: str, ecosystem: str) -> List[Dict]:
+    """Check vulnerabilities for a single package using OSV API"""
+    results = await check_vulnerabilities_osv_batch([package_name], ecosystem)
+    return results[0]
+
+# The vulnerability penalty, min(50, vuln_count * 15), is flat from 4 vulnerabilities up
+MAX_PENALIZED_VULN_COUNT = 4
 
 def calculate_health_score(is_outdated: bool, vuln_count: int, is_deprecated: bool) -> int:
     """Calculate health score (0-100)"""
+    # Clamp so every count on the penalty plateau shares one cache entry
+    return _calculate_health_score(bool(is_outdated), min(vuln_count, MAX_PENALIZED_VULN_COUNT), bool(is_deprecated))
+
+@lru_cache(maxsize=256)
+def _calculate_health_score(is_outdated: bool, vuln_count: int, is_deprecated: bool) -> int:
+    """Calculate health score (0-100), memoized on the clamped inputs"""
     score = 100
     
     if is_outdated:
@@ -245,6 +548,7 @@ def calculate_health_score(is_outdated: bool, vuln_count: int, is_deprecated: bo
     
     return max(0, score)
 
+@lru_cache(maxsize=256)
 def get_recommendation(health_score: int, is_outdated: bool, vuln_count: int, is_deprecated: bool) -> str:
     """Get recommendation based on health metrics"""
     if health_score >= 80:
@@ -258,6 +562,28 @@ def get_recommendation(health_score: int, is_outdated: bool, vuln_count: int, is
     else:
         return "Review package health metrics."
 
+def build_package_result(pkg: PackageDependency, registry_info: Dict, vulnerabilities: List[Dict]) -> Dict[str, Any]:
+    """Combine registry info and vulnerabilities into a package health result"""
+    is_outdated = registry_info.get('is_outdated', False)
+    is_deprecated = registry_info.get('deprecated', False)
+    vuln_count = len(vulnerabilities)
+    
+    health_score = calculate_health_score(is_outdated, vuln_count, is_deprecated)
+    recommendation = get_recommendation(health_score, is_outdated, vuln_count, is_deprecated)
+    
+    return {
+        "name": pkg.name,
+        "current_version": pkg.version,
+        "latest_version": registry_info.get('latest_version'),
+        "is_outdated": is_outdated,
+        "has_vulnerabilities": vuln_count > 0,
+        "vulnerability_count": vuln_count,
+        "is_deprecated": is_deprecated,
+        "health_score": health_score,
+        "recommendation": recommendation,
+        "vulnerabilities": vulnerabilities
+    }
+
 # Initialize package checker and A2A handler
 package_checker = PackageChecker()
 a2a_handler = A2AHandler(package_checker)
@@ -276,10 +602,10 @@ async def a2a_endpoint(request: Request):
     try:
         # Parse raw JSON body
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception as e:
             logger.error(f"JSON parse error: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "jsonrpc": "2.0",
@@ -295,7 +621,7 @@ async def a2a_endpoint(request: Request):
         # Handle empty JSON - return 200 OK
         if not body or body == {}:
             logger.info("Received empty JSON, returning 200 OK")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "status": "ok",
@@ -309,7 +635,7 @@ async def a2a_endpoint(request: Request):
         # Validate JSON-RPC 2.0 structure
         if body.get("jsonrpc") != "2.0":
             logger.warning(f"Invalid jsonrpc version: {body.get('jsonrpc')}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "jsonrpc": "2.0",
@@ -324,7 +650,7 @@ async def a2a_endpoint(request: Request):
         
         if not request_id:
             logger.warning("Missing request id")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "jsonrpc": "2.0",
@@ -342,7 +668,7 @@ async def a2a_endpoint(request: Request):
             rpc_request = JSONRPCRequest(**body)
         except Exception as e:
             logger.error(f"Pydantic validation error: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "jsonrpc": "2.0",
@@ -360,13 +686,14 @@ async def a2a_endpoint(request: Request):
         # Process with A2A handler
         response = await a2a_handler.handle_message(rpc_request)
         
-        logger.info(f"A2A response generated - bytes: {len(str(response.model_dump()))}")
+        json_response = ORJSONResponse(content=response.model_dump())
+        logger.info(f"A2A response generated - bytes: {len(json_response.body)}")
         
-        return JSONResponse(content=response.model_dump())
+        return json_response
     
     except Exception as e:
         logger.exception(f"Internal error in A2A endpoint: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "jsonrpc": "2.0",
@@ -380,6 +707,8 @@ async def a2a_endpoint(request: Request):
         )
 
 # Standard API endpoints (keep for backward compatibility)
+STREAM_DESCRIPTION = "Stream one NDJSON line per package as it finishes, followed by a summary line"
+
 @app.get("/")
 async def root():
     """Welcome endpoint"""
@@ -401,26 +730,46 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+async def _ndjson_stream(packages: List[PackageDependency], ecosystem: str) -> AsyncIterator[bytes]:
+    """Encode streamed package results as newline-delimited JSON"""
+    async for record in package_checker.stream_results(packages, ecosystem):
+        yield orjson.dumps(record) + b"\n"
+
 @app.post("/analyze/python", response_model=OverallHealthResponse)
-async def analyze_python_dependencies(request: PythonDependenciesRequest):
+async def analyze_python_dependencies(request: PythonDependenciesRequest, stream: bool = Query(False, description=STREAM_DESCRIPTION)):
     """Analyze Python dependencies"""
+    if stream:
+        packages = await parse_off_loop(parse_python_packages, request.packages)
+        if not packages:
+            raise HTTPException(status_code=400, detail="No valid packages found")
+        return StreamingResponse(_ndjson_stream(packages, "python"), media_type="application/x-ndjson")
+    
     result = await package_checker.analyze_python(request.packages)
     
     if not result:
         raise HTTPException(status_code=400, detail="No valid packages found")
     
-    return OverallHealthResponse(**result)
+    # FastAPI validates the dict against response_model once
+    return result
 
 @app.post("/analyze/npm", response_model=OverallHealthResponse)
-async def analyze_npm_dependencies(request: NpmDependenciesRequest):
+async def analyze_npm_dependencies(request: NpmDependenciesRequest, stream: bool = Query(False, description=STREAM_DESCRIPTION)):
     """Analyze npm dependencies"""
     all_deps = {**(request.dependencies or {}), **(request.devDependencies or {})}
+    
+    if stream:
+        packages = await parse_off_loop(parse_npm_dependencies, all_deps)
+        if not packages:
+            raise HTTPException(status_code=400, detail="No valid packages found")
+        return StreamingResponse(_ndjson_stream(packages, "npm"), media_type="application/x-ndjson")
+    
     result = await package_checker.analyze_npm(all_deps)
     
     if not result:
         raise HTTPException(status_code=400, detail="No valid packages found")
     
-    return OverallHealthResponse(**result)
+    # FastAPI validates the dict against response_model once
+    return result
 
 @app.post("/check-package", response_model=PackageHealthResponse)
 async def check_single_package(package: PackageDependency, ecosystem: str = Query(..., description="Ecosystem type: 'python' or 'npm'")):
@@ -438,32 +787,17 @@ async def check_single_package(package: PackageDependency, ecosystem: str = Quer
     
     if ecosystem == "python":
         logger.info(f"Checking PyPI for {package.name}")
-        pkg_info = check_pypi_package(package.name, package.version)
+        registry_check = check_pypi_package(package.name, package.version)
     else:
         logger.info(f"Checking npm for {package.name}")
-        pkg_info = check_npm_package(package.name, package.version)
-    
-    vulnerabilities = check_vulnerabilities_osv(package.name, ecosystem)
-    
-    is_outdated = pkg_info.get('is_outdated', False)
-    has_vulns = len(vulnerabilities) > 0
-    is_deprecated = pkg_info.get('deprecated', False)
-    
-    health_score = calculate_health_score(is_outdated, len(vulnerabilities), is_deprecated)
-    recommendation = get_recommendation(health_score, is_outdated, len(vulnerabilities), is_deprecated)
-    
-    return PackageHealthResponse(
-        name=package.name,
-        current_version=package.version,
-        latest_version=pkg_info.get('latest_version'),
-        is_outdated=is_outdated,
-        has_vulnerabilities=has_vulns,
-        vulnerability_count=len(vulnerabilities),
-        is_deprecated=is_deprecated,
-        health_score=health_score,
-        recommendation=recommendation,
-        vulnerabilities=vulnerabilities
+        registry_check = check_npm_package(package.name, package.version)
+    
+    pkg_info, vulnerabilities = await asyncio.gather(
+        registry_check,
+        check_vulnerabilities_osv(package.name, ecosystem)
     )
+    
+    return PackageHealthResponse.model_construct(**build_package_result(package, pkg_info, vulnerabilities))
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,91 @@
+from typing import Dict, List, Set, IO
+import asyncio
+import logging
+import re
+import tempfile
+import zipfile
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+OSV_DUMP_URL = "https://osv-vulnerabilities.storage.googleapis.com/{ecosystem}/all.zip"
+PYPI_NAME_SEPARATORS = re.compile(r'[-_.]+')
+
+
+def normalize_package_name(name: str, ecosystem: str) -> str:
+    """Normalize a package name so index lookups ignore case (and PEP 503 separators on PyPI)"""
+    if ecosystem == "PyPI":
+        return PYPI_NAME_SEPARATORS.sub('-', name).lower()
+    return name.lower()
+
+
+def _read_package_names(dump: IO[bytes], ecosystem: str) -> Set[str]:
+    """Collect affected package names from an OSV all.zip dump"""
+    packages = set()
+
+    with zipfile.ZipFile(dump) as archive:
+        for entry in archive.namelist():
+            advisory = orjson.loads(archive.read(entry))
+            for affected in advisory.get('affected', []):
+                package = affected.get('package', {})
+                # Ecosystems may carry a release suffix, e.g. "Debian:11"
+                if package.get('ecosystem', '').split(':')[0] == ecosystem and package.get('name'):
+                    packages.add(normalize_package_name(package['name'], ecosystem))
+
+    return packages
+
+
+class OSVAdvisoryIndex:
+    """Set of package names with at least one OSV advisory, per ecosystem"""
+
+    def __init__(self, ecosystems: List[str], refresh_seconds: int = 24 * 60 * 60):
+        """
+        Initialize an empty index
+
+        Args:
+            ecosystems: OSV ecosystem names to index, e.g. ["PyPI", "npm"]
+            refresh_seconds: How often run() re-downloads the dumps
+        """
+        self.ecosystems = ecosystems
+        self.refresh_seconds = refresh_seconds
+        self._packages: Dict[str, Set[str]] = {}
+
+    def may_be_affected(self, package_name: str, ecosystem: str) -> bool:
+        """
+        Check whether a package could have advisories
+
+        Returns False only when the ecosystem is indexed and the package has no
+        advisory in it, so callers can safely skip the OSV query.
+        """
+        packages = self._packages.get(ecosystem)
+        if packages is None:
+            return True
+        return normalize_package_name(package_name, ecosystem) in packages
+
+    async def refresh(self, client: httpx.AsyncClient) -> None:
+        """Download and index the dump for every ecosystem, keeping the old index on failure"""
+        for ecosystem in self.ecosystems:
+            try:
+                self._packages[ecosystem] = await self._load(client, ecosystem)
+                logger.info(f"OSV index loaded: {len(self._packages[ecosystem])} {ecosystem} packages")
+            except Exception as e:
+                logger.error(f"Error loading OSV index for {ecosystem}: {e}")
+
+    async def run(self, client: httpx.AsyncClient) -> None:
+        """Keep the index fresh until cancelled"""
+        while True:
+            await self.refresh(client)
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def _load(self, client: httpx.AsyncClient, ecosystem: str) -> Set[str]:
+        """Stream one ecosystem dump to disk and parse it off the event loop"""
+        with tempfile.TemporaryFile() as dump:
+            async with client.stream("GET", OSV_DUMP_URL.format(ecosystem=ecosystem)) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    dump.write(chunk)
+
+            dump.seek(0)
+            return await asyncio.to_thread(_read_package_names, dump, ecosystem)
@@ -0,0 +1,111 @@
+"""
+Dependency parsing helpers
+
+Pure, fully annotated functions so the module can be compiled with mypyc
+(`mypyc parsing.py`); the compiled extension is picked up by the same imports.
+Values come from our own parsing, so models are built with model_construct
+and skip Pydantic validation.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+import re
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import Specifier
+
+from models.schemas import PackageDependency
+
+# e.g. flask==2.0.1, requests>=2.25.0 inside free text
+PYTHON_PACKAGE_PATTERN = re.compile(r'\b([a-zA-Z0-9_-]+)\s*([=<>~!]+)\s*([0-9.]+)\b')
+# e.g. express@4.17.1, axios@0.21.1 inside free text
+NPM_PACKAGE_PATTERN = re.compile(r'\b([a-zA-Z0-9_-]+)@([0-9.^~]+)\b')
+TOKEN_SEPARATORS = re.compile(r'[\s,]+')
+VERSION_OPERATORS: Tuple[str, ...] = ('==', '>=', '<=', '>', '<', '~=')
+NPM_RANGE_PREFIXES = '^~>=<'
+
+
+def requirement_version(requirement: Requirement) -> Optional[str]:
+    """Pick the version a requirement refers to: an exact pin, else a single lower/upper bound"""
+    specifiers: List[Specifier] = list(requirement.specifier)
+    for specifier in specifiers:
+        if specifier.operator in ('==', '==='):
+            return specifier.version
+
+    if len(specifiers) == 1 and specifiers[0].operator != '!=':
+        return specifiers[0].version
+    return None
+
+
+def parse_python_packages(specs: List[str]) -> List[PackageDependency]:
+    """Parse PEP 508 requirement lines like "flask[async]>=2.0; python_version>='3.8'" into dependencies"""
+    packages: List[PackageDependency] = []
+    for spec in specs:
+        # Drop inline comments the way pip does (" #" or a leading "#")
+        line = spec.partition(' #')[0].strip()
+        if not line or line.startswith('#'):
+            continue
+
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            continue
+
+        packages.append(PackageDependency.model_construct(
+            name=requirement.name,
+            version=requirement_version(requirement)
+        ))
+
+    return packages
+
+
+def parse_npm_dependencies(dependencies: Dict[str, str]) -> List[PackageDependency]:
+    """Parse npm name -> version range pairs into dependencies"""
+    packages: List[PackageDependency] = []
+    for name, version in dependencies.items():
+        packages.append(PackageDependency.model_construct(name=name, version=version.lstrip(NPM_RANGE_PREFIXES)))
+
+    return packages
+
+
+def is_requirement(spec: str) -> bool:
+    """Check whether a string parses as a PEP 508 requirement"""
+    try:
+        Requirement(spec)
+    except InvalidRequirement:
+        return False
+    return True
+
+
+def extract_python_packages(text: str) -> List[str]:
+    """Extract Python package specifications from free text"""
+    packages: List[str] = []
+    seen: Set[str] = set()
+
+    # Words containing a version operator, e.g. zope.interface==5.0 or pkg==2.0.0rc1
+    words: List[str] = [word for word in TOKEN_SEPARATORS.split(text) if any(op in word for op in VERSION_OPERATORS)]
+    requirements: List[str] = [word for word in words if is_requirement(word)]
+
+    # Packages like: flask==2.0.1, requests >= 2.25.0; skip matches that are only
+    # part of a valid requirement, such as "interface==5.0" inside "zope.interface==5.0"
+    for pkg_name, operator, version in PYTHON_PACKAGE_PATTERN.findall(text):
+        spec = f"{pkg_name}{operator}{version}"
+        if spec not in seen and not any(spec in requirement for requirement in requirements):
+            packages.append(spec)
+            seen.add(spec)
+
+    for word in words:
+        if word not in seen:
+            packages.append(word)
+            seen.add(word)
+
+    return packages
+
+
+def extract_npm_packages(text: str) -> Dict[str, str]:
+    """Extract npm package specifications from free text"""
+    dependencies: Dict[str, str] = {}
+
+    # Packages like: express@4.17.1, axios@0.21.1
+    for pkg_name, version in NPM_PACKAGE_PATTERN.findall(text):
+        dependencies[pkg_name] = version
+
+    return dependencies
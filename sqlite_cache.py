@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import logging
+import time
+
+import orjson
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's limit on bound parameters per statement
+MAX_KEYS_PER_QUERY = 500
+
+
+class SQLiteCache:
+    """Persistent key/value cache with per-entry expiry, backed by SQLite"""
+
+    def __init__(self, path: str, ttl_seconds: int = 24 * 60 * 60):
+        """
+        Initialize the cache; call open() before use
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: How long stored values stay valid
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._db: Optional["aiosqlite.Connection"] = None
+
+    async def open(self) -> None:
+        """Open the database, create the table and drop expired entries"""
+        # Imported here so deployments without a cache never load sqlite
+        import aiosqlite
+
+        self._db = await aiosqlite.connect(self.path)
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v BLOB NOT NULL, expires INTEGER NOT NULL)"
+        )
+        await self._db.execute("DELETE FROM cache WHERE expires <= ?", (int(time.time()),))
+        await self._db.commit()
+        logger.info(f"SQLite cache opened at {self.path}")
+
+    async def close(self) -> None:
+        """Close the database"""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def get(self, key: str) -> Any:
+        """Return the stored value for key, or None if missing or expired"""
+        values = await self.get_many([key])
+        return values.get(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return stored values for whichever keys are present and not expired"""
+        values: Dict[str, Any] = {}
+        if self._db is None or not keys:
+            return values
+
+        try:
+            now = int(time.time())
+            for start in range(0, len(keys), MAX_KEYS_PER_QUERY):
+                chunk = keys[start:start + MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                async with self._db.execute(
+                    f"SELECT k, v FROM cache WHERE k IN ({placeholders}) AND expires > ?",
+                    (*chunk, now)
+                ) as cursor:
+                    async for key, value in cursor:
+                        values[key] = orjson.loads(value)
+        except Exception as e:
+            logger.error(f"Error reading SQLite cache: {e}")
+
+        return values
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value for key"""
+        await self.set_many({key: value})
+
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several values in one transaction"""
+        if self._db is None or not items:
+            return
+
+        try:
+            expires = int(time.time()) + self.ttl_seconds
+            await self._db.executemany(
+                "INSERT OR REPLACE INTO cache (k, v, expires) VALUES (?, ?, ?)",
+                [(key, orjson.dumps(value), expires) for key, value in items.items()]
+            )
+            await self._db.commit()
+        except Exception as e:
+            logger.error(f"Error writing SQLite cache: {e}")
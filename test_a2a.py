@@ -1,4 +1,4 @@
-import requests
+import httpx
 import json
 
 # Test A2A endpoint
@@ -26,7 +26,7 @@ request_data = {
     }
 }
 
-response = requests.post(url, json=request_data)
+response = httpx.post(url, json=request_data, timeout=60)
 print(f"Status: {response.status_code}")
 print(f"Response: {json.dumps(response.json(), indent=2)}\n")
 
@@ -52,7 +52,7 @@ request_data = {
     }
 }
 
-response = requests.post(url, json=request_data)
+response = httpx.post(url, json=request_data, timeout=60)
 print(f"Status: {response.status_code}")
 result = response.json()
 if "result" in result and "status" in result["result"]:
@@ -81,7 +81,7 @@ request_data = {
     }
 }
 
-response = requests.post(url, json=request_data)
+response = httpx.post(url, json=request_data, timeout=60)
 print(f"Status: {response.status_code}")
 result = response.json()
 if "result" in result and "status" in result["result"]: